@@ -2,140 +2,157 @@ import tkinter as tk
 from tkinter import Canvas
 import psutil
 import threading
-import time
-from PIL import Image, ImageDraw
+from PIL import Image, ImageDraw, ImageFont, ImageTk
 import pystray
 from pystray import MenuItem as item
+import os
 import sys
 
 try:
-    import GPUtil
+    import pynvml
     GPU_AVAILABLE = True
 except ImportError:
     GPU_AVAILABLE = False
 
 
+def _compute_color(value_percent):
+    """Calculate gradient color from green to yellow to red based on percentage"""
+    # 0-50%: green to yellow
+    # 50-100%: yellow to red
+
+    if value_percent <= 50:
+        # Green to Yellow
+        ratio = value_percent / 50.0
+        r = int(76 + (255 - 76) * ratio)
+        g = int(175 + (235 - 175) * ratio)
+        b = int(80 - 80 * ratio)
+    else:
+        # Yellow to Red
+        ratio = (value_percent - 50) / 50.0
+        r = 255
+        g = int(235 - (235 - 82) * ratio)
+        b = int(59 * (1 - ratio))
+
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
+def _compute_temp_color(temp_celsius):
+    """Calculate color for GPU temperature (different thresholds than percentage)"""
+    # < 50°C: green
+    # 50-60°C: yellow
+    # 60-70°C: orange
+    # > 70°C: red
+
+    if temp_celsius < 50:
+        # Green
+        return "#4CAF50"
+    elif temp_celsius < 60:
+        # Green to Yellow transition
+        ratio = (temp_celsius - 50) / 10.0
+        r = int(76 + (255 - 76) * ratio)
+        g = int(175 + (235 - 175) * ratio)
+        b = int(80 - 80 * ratio)
+        return f"#{r:02x}{g:02x}{b:02x}"
+    elif temp_celsius < 70:
+        # Yellow to Orange transition
+        ratio = (temp_celsius - 60) / 10.0
+        r = 255
+        g = int(235 - (235 - 165) * ratio)  # 235 to 165
+        b = int(59 * (1 - ratio))
+        return f"#{r:02x}{g:02x}{b:02x}"
+    else:
+        # Orange to Red (70°C+)
+        ratio = min((temp_celsius - 70) / 30.0, 1.0)  # Cap at 100°C
+        r = 255
+        g = int(165 - (165 - 82) * ratio)  # 165 to 82
+        b = int(59 * (1 - ratio))
+        return f"#{r:02x}{g:02x}{b:02x}"
+
+
+# Precomputed gradients over the whole integer domain - color selection in
+# update() is a single tuple index instead of arithmetic plus a format call
+COLOR_LUT = tuple(_compute_color(p) for p in range(101))
+TEMP_LUT = tuple(_compute_temp_color(t) for t in range(121))
+
+
 class ResourceBubble:
     """Visual bubble indicator for a single resource metric"""
-    
-    def __init__(self, canvas, x, y, width, height, label, max_value=100, unit="%", is_temperature=False):
-        self.canvas = canvas
-        self.x = x
-        self.y = y
-        self.width = width
-        self.height = height
+
+    __slots__ = (
+        'font', 'x', 'y', 'width', 'height', 'label', 'max_value',
+        'unit', 'value', 'is_temperature', '_last_color', '_last_text',
+        '_last_fill_w', '_text_lut',
+    )
+
+    def __init__(self, font, x, y, width, height, label, max_value=100, unit="%", is_temperature=False):
+        self.font = font
+        self.x = int(x)
+        self.y = int(y)
+        self.width = int(width)
+        self.height = int(height)
         self.label = label
         self.max_value = max_value
         self.unit = unit
         self.value = 0
         self.is_temperature = is_temperature
-        
-        # Create bubble background - dark theme
-        self.bg_rect = canvas.create_rectangle(
-            x, y, x + width, y + height,
-            fill="#2b2b2b", outline="#404040", width=1
-        )
-        
-        # Create fill rectangle (will be colored based on value)
-        self.fill_rect = canvas.create_rectangle(
-            x, y, x, y + height,
-            fill="#4CAF50", outline=""
-        )
-        
-        # Create label text - light text for dark theme
-        text_y = y + height // 2
-        self.label_text = canvas.create_text(
-            x + 5, text_y,
-            text=label, anchor="w",
-            font=("Segoe UI", 8, "bold"), fill="#e0e0e0"
-        )
-        
-        # Create value text - light text for dark theme
-        self.value_text = canvas.create_text(
-            x + width - 5, text_y,
-            text=f"0{unit}", anchor="e",
-            font=("Segoe UI", 8, "bold"), fill="#e0e0e0"
+
+        # Last rendered state - lets update() report "unchanged" so the
+        # monitor can skip redrawing when a metric plateaus (common for
+        # RAM/Temp)
+        self._last_color = "#4CAF50"
+        self._last_fill_w = 0
+
+        # Pre-formatted display strings for every integer value - update()
+        # indexes this instead of building an f-string per tick, and the
+        # unchanged-text check becomes an identity comparison. The static
+        # label is baked in so one draw call covers the whole bubble.
+        self._text_lut = tuple(
+            f"{label}  {i}{unit}" for i in range(int(max_value) + 1)
         )
-    
-    def interpolate_color(self, value_percent):
-        """Calculate gradient color from green to yellow to red based on percentage"""
-        # 0-50%: green to yellow
-        # 50-100%: yellow to red
-        
-        if value_percent <= 50:
-            # Green to Yellow
-            ratio = value_percent / 50.0
-            r = int(76 + (255 - 76) * ratio)
-            g = int(175 + (235 - 175) * ratio)
-            b = int(80 - 80 * ratio)
-        else:
-            # Yellow to Red
-            ratio = (value_percent - 50) / 50.0
-            r = 255
-            g = int(235 - (235 - 82) * ratio)
-            b = int(59 * (1 - ratio))
-        
-        return f"#{r:02x}{g:02x}{b:02x}"
-    
-    def interpolate_temperature_color(self, temp_celsius):
-        """Calculate color for GPU temperature (different thresholds than percentage)"""
-        # < 50°C: green
-        # 50-60°C: yellow
-        # 60-70°C: orange
-        # > 70°C: red
-        
-        if temp_celsius < 50:
-            # Green
-            return "#4CAF50"
-        elif temp_celsius < 60:
-            # Green to Yellow transition
-            ratio = (temp_celsius - 50) / 10.0
-            r = int(76 + (255 - 76) * ratio)
-            g = int(175 + (235 - 175) * ratio)
-            b = int(80 - 80 * ratio)
-            return f"#{r:02x}{g:02x}{b:02x}"
-        elif temp_celsius < 70:
-            # Yellow to Orange transition
-            ratio = (temp_celsius - 60) / 10.0
-            r = 255
-            g = int(235 - (235 - 165) * ratio)  # 235 to 165
-            b = int(59 * (1 - ratio))
-            return f"#{r:02x}{g:02x}{b:02x}"
-        else:
-            # Orange to Red (70°C+)
-            ratio = min((temp_celsius - 70) / 30.0, 1.0)  # Cap at 100°C
-            r = 255
-            g = int(165 - (165 - 82) * ratio)  # 165 to 82
-            b = int(59 * (1 - ratio))
-            return f"#{r:02x}{g:02x}{b:02x}"
-    
+        self._last_text = self._text_lut[0]
+
     def update(self, value):
-        """Update bubble with new value"""
+        """Update bubble state with a new value; returns True if the
+        rendered appearance changed"""
         self.value = min(value, self.max_value)
         value_percent = (self.value / self.max_value) * 100
-        
+
         # Calculate fill width
-        fill_width = (self.value / self.max_value) * self.width
-        
-        # Update fill rectangle
-        self.canvas.coords(
-            self.fill_rect,
-            self.x, self.y, self.x + fill_width, self.y + self.height
-        )
-        
-        # Update color - use temperature-specific coloring if this is a temperature metric
+        fill_width = int((self.value / self.max_value) * self.width)
+
+        # Color - use temperature-specific coloring if this is a temperature metric
         if self.is_temperature:
-            color = self.interpolate_temperature_color(self.value)
-        else:
-            color = self.interpolate_color(value_percent)
-        self.canvas.itemconfig(self.fill_rect, fill=color)
-        
-        # Update value text
-        if self.unit == "°C":
-            text = f"{int(self.value)}{self.unit}"
+            color = TEMP_LUT[min(int(self.value), 120)]
         else:
-            text = f"{self.value:.0f}{self.unit}"
-        self.canvas.itemconfig(self.value_text, text=text)
+            color = COLOR_LUT[int(value_percent)]
+
+        text = self._text_lut[min(int(self.value), int(self.max_value))]
+
+        if (fill_width == self._last_fill_w
+                and color == self._last_color
+                and text is self._last_text):
+            return False
+
+        self._last_fill_w = fill_width
+        self._last_color = color
+        self._last_text = text
+        return True
+
+    def draw(self, draw):
+        """Render this bubble into the shared frame via an ImageDraw"""
+        x, y = self.x, self.y
+        x2, y2 = x + self.width, y + self.height
+
+        # Bubble background - dark theme
+        draw.rectangle([x, y, x2, y2], fill="#2b2b2b", outline="#404040")
+
+        # Fill bar colored by value
+        if self._last_fill_w > 0:
+            draw.rectangle([x, y, x + self._last_fill_w, y2], fill=self._last_color)
+
+        # Combined label+value text - light text for dark theme
+        text_y = y + (self.height - 12) // 2
+        draw.text((x + 5, text_y), self._last_text, font=self.font, fill="#e0e0e0")
 
 
 class ResourceMonitor:
@@ -161,6 +178,8 @@ class ResourceMonitor:
         # Variables for dragging
         self.offset_x = 0
         self.offset_y = 0
+        self._drag_target = (0, 0)
+        self._drag_pending = False
         
         # Running flag
         self.running = True
@@ -168,15 +187,43 @@ class ResourceMonitor:
         
         # Tray icon
         self.tray_icon = None
-        
+
+        # GPU handle - NVML keeps a persistent handle so polling is a
+        # library call instead of a nvidia-smi subprocess per tick.
+        # The sampler is bound once here so the per-tick path has no
+        # availability branch; runtime failures rebind it to the no-op.
+        self.gpu_handle = None
+        self._sample_gpu = self._sample_gpu_none
+        if GPU_AVAILABLE:
+            try:
+                pynvml.nvmlInit()
+                self.gpu_handle = pynvml.nvmlDeviceGetHandleByIndex(0)  # First GPU
+                self._sample_gpu = self._sample_gpu_nvml
+            except Exception as e:
+                print(f"NVML init error: {e}")
+
         self.create_widgets()
         self.setup_dragging()
         self.create_tray_icon()
         
-        # Start monitoring thread
-        self.monitor_thread = threading.Thread(target=self.update_stats, daemon=True)
-        self.monitor_thread.start()
-        
+        # Prime psutil's internal CPU counters so the first reading a
+        # second from now is meaningful instead of 0.0
+        psutil.cpu_percent(interval=None)
+
+        # RAM percent changes slowly, so _tick only rereads the platform
+        # memory counters every other tick and reuses this cached value
+        # in between
+        self._tick_count = 0
+        self._ram_percent = psutil.virtual_memory().percent
+
+        # Reusable sample buffer (cpu, ram, gpu, vram, temp) - _tick fills
+        # it in place so no per-tick tuple becomes garbage
+        self._stats = [0.0] * 5
+
+        # Sampling runs directly on the Tk event loop - every call is
+        # sub-millisecond now, so no worker thread or after(0) marshaling
+        self.root.after(1000, self._tick)
+
         # Handle window close
         self.root.protocol("WM_DELETE_WINDOW", self.hide_window)
         
@@ -191,45 +238,71 @@ class ResourceMonitor:
             highlightthickness=0
         )
         self.canvas.pack(fill='both', expand=True)
-        
+
+        # Single backing image for the whole bar - bubbles render into this
+        # reused PIL buffer and one PhotoImage paste replaces ~15 canvas
+        # items worth of Tcl traffic per tick
+        self._frame = Image.new(
+            'RGB', (self.window_width, self.window_height), '#1e1e1e'
+        )
+        self._frame_draw = ImageDraw.Draw(self._frame)
+        self._photo = ImageTk.PhotoImage(self._frame)
+        self.canvas.create_image(0, 0, anchor='nw', image=self._photo)
+
+        # Bubble text is rasterized by PIL now, so the font comes from PIL too
+        try:
+            bubble_font = ImageFont.truetype("segoeui.ttf", 12)
+        except OSError:
+            bubble_font = ImageFont.load_default()
+
         # Create resource bubbles - 5 metrics in a row
         bubble_width = 85
         bubble_height = 30
         bubble_y = 5
         spacing = 3
-        
+
         start_x = 5
-        
+
         # CPU Bubble
         self.cpu_bubble = ResourceBubble(
-            self.canvas, start_x, bubble_y, bubble_width, bubble_height, 
+            bubble_font, start_x, bubble_y, bubble_width, bubble_height,
             "CPU", 100, "%"
         )
-        
+
         # RAM Bubble
         self.ram_bubble = ResourceBubble(
-            self.canvas, start_x + (bubble_width + spacing) * 1, bubble_y, 
+            bubble_font, start_x + (bubble_width + spacing) * 1, bubble_y,
             bubble_width, bubble_height, "RAM", 100, "%"
         )
-        
+
         # GPU Bubble
         self.gpu_bubble = ResourceBubble(
-            self.canvas, start_x + (bubble_width + spacing) * 2, bubble_y, 
+            bubble_font, start_x + (bubble_width + spacing) * 2, bubble_y,
             bubble_width, bubble_height, "GPU", 100, "%"
         )
-        
+
         # VRAM Bubble
         self.vram_bubble = ResourceBubble(
-            self.canvas, start_x + (bubble_width + spacing) * 3, bubble_y, 
+            bubble_font, start_x + (bubble_width + spacing) * 3, bubble_y,
             bubble_width, bubble_height, "VRAM", 100, "%"
         )
-        
+
         # GPU Temperature Bubble (with special temperature coloring)
         self.temp_bubble = ResourceBubble(
-            self.canvas, start_x + (bubble_width + spacing) * 4, bubble_y, 
+            bubble_font, start_x + (bubble_width + spacing) * 4, bubble_y,
             bubble_width, bubble_height, "Temp", 100, "°C", is_temperature=True
         )
-        
+
+        self.bubbles = (
+            self.cpu_bubble, self.ram_bubble, self.gpu_bubble,
+            self.vram_bubble, self.temp_bubble,
+        )
+
+        # Initial render so the bar isn't blank before the first tick
+        for bubble in self.bubbles:
+            bubble.draw(self._frame_draw)
+        self._photo.paste(self._frame)
+
     def setup_dragging(self):
         """Setup window dragging"""
         def start_move(event):
@@ -237,20 +310,41 @@ class ResourceMonitor:
             self.offset_y = event.y
             
         def do_move(event):
-            x = self.root.winfo_x() + event.x - self.offset_x
-            y = self.root.winfo_y() + event.y - self.offset_y
-            self.root.geometry(f'+{x}+{y}')
-        
+            # Motion events arrive faster than the WM can reposition the
+            # window - remember only the latest target and apply it at
+            # ~60 Hz, discarding the intermediate positions
+            self._drag_target = (
+                self.root.winfo_x() + event.x - self.offset_x,
+                self.root.winfo_y() + event.y - self.offset_y,
+            )
+            if not self._drag_pending:
+                self._drag_pending = True
+                self.root.after(16, self._apply_drag)
+
         self.canvas.bind('<Button-1>', start_move)
         self.canvas.bind('<B1-Motion>', do_move)
-    
+
+    def _apply_drag(self):
+        """Apply the most recent drag position (coalesces motion events)"""
+        self._drag_pending = False
+        x, y = self._drag_target
+        self.root.geometry(f'+{x}+{y}')
+
     def create_tray_icon(self):
         """Create system tray icon"""
-        # Create simple icon
-        image = Image.new('RGB', (64, 64), color='#4CAF50')
-        draw = ImageDraw.Draw(image)
-        draw.rectangle([8, 8, 56, 56], fill='white')
-        draw.text((16, 20), 'RM', fill='#4CAF50')
+        # Load the bundled icon - skips the slow PIL default-font load
+        # that drawing the text fallback triggers on cold start
+        icon_path = os.path.join(
+            os.path.dirname(os.path.abspath(__file__)), 'icon.png'
+        )
+        try:
+            image = Image.open(icon_path)
+        except OSError:
+            # Draw the icon only if the bundled file is missing
+            image = Image.new('RGB', (64, 64), color='#4CAF50')
+            draw = ImageDraw.Draw(image)
+            draw.rectangle([8, 8, 56, 56], fill='white')
+            draw.text((16, 20), 'RM', fill='#4CAF50')
         
         # Tray menu
         menu = pystray.Menu(
@@ -261,7 +355,8 @@ class ResourceMonitor:
         self.tray_icon = pystray.Icon("resource_monitor", image, "Resource Monitor", menu)
         
         # Run icon in separate thread
-        threading.Thread(target=self.tray_icon.run, daemon=True).start()
+        self._tray_thread = threading.Thread(target=self.tray_icon.run, daemon=True)
+        self._tray_thread.start()
     
     def toggle_window(self, icon=None, item=None):
         """Toggle window visibility"""
@@ -280,86 +375,98 @@ class ResourceMonitor:
         self.root.deiconify()
         self.window_visible = True
     
-    def get_gpu_stats(self):
-        """Get GPU statistics including temperature"""
-        if not GPU_AVAILABLE:
-            return None, None, None
-        
+    def _sample_gpu_nvml(self):
+        """Get GPU statistics including temperature via the cached NVML handle"""
         try:
-            gpus = GPUtil.getGPUs()
-            if gpus:
-                gpu = gpus[0]  # First GPU
-                gpu_load = gpu.load * 100
-                vram_load = gpu.memoryUtil * 100
-                temperature = gpu.temperature if hasattr(gpu, 'temperature') else None
-                return gpu_load, vram_load, temperature
+            util = pynvml.nvmlDeviceGetUtilizationRates(self.gpu_handle)
+            mem = pynvml.nvmlDeviceGetMemoryInfo(self.gpu_handle)
+            temperature = pynvml.nvmlDeviceGetTemperature(
+                self.gpu_handle, pynvml.NVML_TEMPERATURE_GPU
+            )
+            return util.gpu, (mem.used / mem.total) * 100, temperature
         except Exception as e:
             print(f"GPU stats error: {e}")
-        
+            # Driver went away - stop probing it every tick
+            self._sample_gpu = self._sample_gpu_none
+            return None, None, None
+
+    def _sample_gpu_none(self):
+        """Fallback when no working GPU is available"""
         return None, None, None
     
-    def update_stats(self):
-        """Update statistics in separate thread"""
-        while self.running:
-            try:
-                # CPU
-                cpu_percent = psutil.cpu_percent(interval=1)
-                
-                # RAM
-                ram = psutil.virtual_memory()
-                ram_percent = ram.percent
-                
-                # GPU, VRAM, Temperature
-                gpu_percent, vram_percent, gpu_temp = self.get_gpu_stats()
-                
-                # Update UI
-                self.root.after(0, self.update_bubbles, 
-                               cpu_percent, ram_percent, 
-                               gpu_percent, vram_percent, gpu_temp)
-                
-                time.sleep(1)  # Update every second
-            except Exception as e:
-                print(f"Update error: {e}")
-                time.sleep(1)
+    def _tick(self):
+        """Sample statistics and refresh the display, once per second"""
+        if not self.running:
+            return
+
+        self._tick_count += 1
+
+        try:
+            stats = self._stats
+
+            # CPU - non-blocking; the after() interval controls the cadence
+            stats[0] = psutil.cpu_percent(interval=None)
+
+            # RAM - refreshed every other tick, cached in between
+            if self._tick_count % 2 == 0:
+                self._ram_percent = psutil.virtual_memory().percent
+            stats[1] = self._ram_percent
+
+            # GPU, VRAM, Temperature
+            gpu_percent, vram_percent, gpu_temp = self._sample_gpu()
+            stats[2] = gpu_percent if gpu_percent is not None else 0
+            stats[3] = vram_percent if vram_percent is not None else 0
+            stats[4] = gpu_temp if gpu_temp is not None else 0
+
+            self.update_bubbles()
+        except Exception as e:
+            print(f"Update error: {e}")
+
+        # Update every second while visible, back off to 5s in the tray
+        self.root.after(1000 if self.window_visible else 5000, self._tick)
     
-    def update_bubbles(self, cpu, ram, gpu, vram, temp):
-        """Update all bubble displays"""
-        self.cpu_bubble.update(cpu)
-        self.ram_bubble.update(ram)
-        
-        if gpu is not None:
-            self.gpu_bubble.update(gpu)
-        else:
-            self.gpu_bubble.update(0)
-        
-        if vram is not None:
-            self.vram_bubble.update(vram)
-        else:
-            self.vram_bubble.update(0)
-        
-        if temp is not None:
-            self.temp_bubble.update(temp)
-        else:
-            self.temp_bubble.update(0)
+    def update_bubbles(self):
+        """Update all bubble displays from the reusable stats buffer"""
+        # Nothing gets painted while hidden in the tray - skip the
+        # canvas work entirely; the bubbles catch up on the next visible tick
+        if not self.window_visible:
+            return
+
+        # Redraw only the bubbles whose appearance changed - the frame
+        # buffer persists between ticks - then push the whole bar to the
+        # canvas with a single PhotoImage paste
+        dirty = False
+        for bubble, value in zip(self.bubbles, self._stats):
+            if bubble.update(value):
+                bubble.draw(self._frame_draw)
+                dirty = True
+
+        if dirty:
+            self._photo.paste(self._frame)
     
     def force_topmost(self):
-        self.root.attributes('-topmost', False)  # Toggle off briefly
-        self.root.attributes('-topmost', True)   # Toggle back on
-        self.root.lift()  # Force raise in z-order
-        self.root.after(100, self.force_topmost)  # Repeat every 0.5 sec; adjust if needed
+        # -topmost is already set once in __init__; just reassert it
+        # occasionally in case the WM dropped it. The old 100ms off/on
+        # toggle plus lift() was ~10 Tk round-trips per second of pure idle load.
+        self.root.attributes('-topmost', True)
+        self.root.after(5000, self.force_topmost)  # Reassert every 5 sec
 
     def quit_app(self, icon=None, item=None):
         """Exit application"""
         self.running = False
         
-        # Properly stop and remove tray icon
+        # Properly stop and remove tray icon, waiting (bounded) for the
+        # tray thread to finish cleanup instead of sleeping a fixed 100ms.
+        # pystray runs menu callbacks on the tray thread itself, so when
+        # quit_app arrives via the Exit menu item joining would raise
+        # "cannot join current thread" - skip it then; the thread is a
+        # daemon and stop() has already done the work.
         if self.tray_icon:
             self.tray_icon.visible = False
             self.tray_icon.stop()
-        
-        # Give tray icon time to cleanup
-        time.sleep(0.1)
-        
+            if self._tray_thread is not threading.current_thread():
+                self._tray_thread.join(timeout=0.5)
+
         # Destroy window and exit
         try:
             self.root.quit()